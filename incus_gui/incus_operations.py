@@ -5,17 +5,311 @@ including launching, listing, toggling, restarting, and deleting containers,
 as well as listing profiles and managing installations.
 """
 
+import requests
 import requests_unixsocket
+import functools
+import http.client
+import json
 import time
 import subprocess
 import shutil
 import platform
+import string
+import socket
+import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import quote, unquote, urlparse
+from requests_unixsocket.adapters import UnixAdapter, UnixHTTPConnection
+from urllib3 import HTTPConnectionPool
 from PySide6.QtWidgets import QMessageBox 
 
+try:
+    # Optional: orjson encodes and decodes several times faster than json
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 SOCKET_PATH = "/var/lib/incus/unix.socket"
-BASE_URL = f"http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0"
+SOCKET_URL = "http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket"
+BASE_URL = f"{SOCKET_URL}/1.0"
+
+# Seconds to wait for apt-cache / snap when looking up installable versions
+VERSION_QUERY_TIMEOUT = 15
+
+# Refresh the package index and install incus under a single sudo invocation
+APT_UPDATE_AND_INSTALL = ["sudo", "sh", "-c", "apt update && apt install -y incus"]
+
+# Concurrent /state requests used when the server does not support recursion
+STATE_QUERY_WORKERS = 8
+
+# Seconds a start/stop may take before Incus reports it as failed
+STATE_CHANGE_TIMEOUT = 30
+
+# Seconds to wait for a start/stop operation; longer than STATE_CHANGE_TIMEOUT
+# so a server-side timeout is reported as the operation's own failure
+STATE_CHANGE_WAIT = STATE_CHANGE_TIMEOUT + 10
+
+# Request path of the container listing; recursion=1 already includes each
+# instance's status, recursion=2 would also embed full state and snapshot
+# lists, which can make the response huge
+_INSTANCES_PATH = "/1.0/instances?recursion=1"
+
+# toggle_container() request bodies, encoded once
+_STATE_CHANGE_BODIES = {
+    action: _dumps({"action": action, "timeout": STATE_CHANGE_TIMEOUT, "force": False})
+    for action in ("start", "stop")
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Simplestreams servers behind the remotes the incus CLI ships with by default
+IMAGE_REMOTES = {
+    "images": "https://images.linuxcontainers.org",
+}
+
+# Preseed consumed by "incus admin init --preseed"; see generate_preseed_file()
+_PRESEED_TEMPLATE = string.Template(
+    "config:\n"
+    "  core.https_address: 0.0.0.0\n"
+    "  core.trust_password: ''\n"
+    "storage_pools:\n"
+    "- name: $storage\n"
+    "  driver: dir\n"
+    "networks:\n"
+    "- name: $network\n"
+    "  type: bridge\n"
+    "  config:\n"
+    "    ipv4.address: auto\n"
+    "    ipv6.address: auto\n"
+)
+
+
+class _SocketConnectionPool(HTTPConnectionPool):
+    """Connection pool for a unix socket that keeps up to ``maxsize`` idle connections."""
+
+    def __init__(self, socket_url, timeout=60, maxsize=8):
+        super().__init__("localhost", maxsize=maxsize)
+        self.socket_url = socket_url
+        self.socket_timeout = timeout
+
+    def _new_conn(self):
+        return UnixHTTPConnection(self.socket_url, self.socket_timeout)
+
+
+class _SocketAdapter(UnixAdapter):
+    """Unix-socket adapter that pools connections per socket.
+
+    The stock requests_unixsocket adapter keeps a separate single-connection
+    pool per request URL, so a keep-alive connection is only reused when the
+    exact same URL is requested again.
+    """
+
+    def get_connection(self, url, proxies=None):
+        socket_url = f"http+unix://{urlparse(url).netloc}"
+        with self.pools.lock:
+            pool = self.pools.get(socket_url)
+            if pool is None:
+                pool = _SocketConnectionPool(socket_url, self.timeout, self._pool_maxsize)
+                self.pools[socket_url] = pool
+        return pool
+
+
+# Shared session so repeated calls reuse the pooled keep-alive socket connections
+_SESSION = requests_unixsocket.Session()
+_SESSION.mount("http+unix://", _SocketAdapter(pool_connections=1, pool_maxsize=8))
+
+
+def _send(method, url, **kwargs):
+    """Send a request on the shared session, retrying a GET once if the connection drops.
+
+    Other methods are not retried: the request may have taken effect before the
+    connection was lost, and repeating a PUT or DELETE would fail or act twice.
+
+    Args:
+        method (str): Session method to call, e.g. "get" or "put".
+        url (str): Request URL.
+        **kwargs: Passed through to the session method.
+
+    Returns:
+        requests.Response: The response.
+    """
+    try:
+        return getattr(_SESSION, method)(url, **kwargs)
+    except requests.exceptions.ConnectionError:
+        if method != "get":
+            raise
+        # Pooled connections go stale when incusd restarts; urllib3 has already
+        # discarded the broken one, so the retry gets a fresh connection
+        return _SESSION.get(url, **kwargs)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Plain http.client connection to the Incus unix socket.
+
+    Used on hot read paths where the requests/urllib3 stack costs more than
+    the request itself.
+    """
+
+    def __init__(self, socket_path, timeout=30):
+        super().__init__("incus", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+_RAW_CONN = _UnixHTTPConnection(SOCKET_PATH)
+_RAW_LOCK = threading.Lock()
+
+
+def _raw_get(path):
+    """Issue a GET on the persistent raw unix-socket connection.
+
+    Args:
+        path (str): Request path, e.g. '/1.0/instances'.
+
+    Returns:
+        tuple: (status_code, body) where body is the raw response bytes.
+
+    Raises:
+        OSError, http.client.HTTPException: If the connection fails; the
+            connection is reset so the next call reconnects.
+    """
+    with _RAW_LOCK:
+        try:
+            _RAW_CONN.request("GET", path)
+            resp = _RAW_CONN.getresponse()
+            return resp.status, resp.read()
+        except Exception:
+            _RAW_CONN.close()
+            raise
+
+
+def prewarm_connections():
+    """Open the raw and pooled socket connections ahead of the first real request.
+
+    Meant to run on a background thread at startup so the first container
+    refresh doesn't pay for connection setup. Failures are ignored; the
+    regular calls report them.
+    """
+    try:
+        _raw_get("/1.0")
+        _SESSION.get(BASE_URL)
+    except Exception:
+        pass
+
+
+def _ttl_cache(seconds=30):
+    """Cache a function's return value for a limited time.
+
+    Results are keyed on the call arguments and reused until they are older
+    than ``seconds``. The wrapped function gains a ``cache_clear()`` method for
+    explicit invalidation.
+
+    Args:
+        seconds (float, optional): How long a cached result stays valid. Defaults to 30.
+    """
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+            value = func(*args, **kwargs)
+            cache[key] = (now, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _json(resp):
+    """Decode the JSON body of a response, with orjson when available.
+
+    Args:
+        resp (requests.Response): Response to decode.
+
+    Returns:
+        dict: The decoded body.
+    """
+    return _loads(resp.content)
+
+
+def _wait_for_operation(resp, timeout=60):
+    """Wait for the background operation started by an API call to finish.
+
+    Args:
+        resp (requests.Response): Response of an asynchronous API request.
+        timeout (int, optional): Seconds the server may block before giving up,
+            or -1 to wait indefinitely. Defaults to 60.
+
+    Returns:
+        dict: Metadata of the finished operation.
+
+    Raises:
+        Exception: If the operation fails.
+    """
+    operation = _json(resp).get("operation")
+    if not operation:
+        return {}
+    wait_resp = _send("get", f"{SOCKET_URL}{operation}/wait?timeout={timeout}")
+    data = _json(wait_resp)
+    metadata = data.get("metadata") or {}
+    if wait_resp.status_code != 200 or metadata.get("status") == "Failure":
+        raise Exception(metadata.get("err") or data.get("error") or f"Operation {operation} failed")
+    return metadata
+
+
+def _image_source(image):
+    """Build the instance source for an image reference such as 'images:ubuntu/24.04'.
+
+    Args:
+        image (str): Image alias, optionally prefixed with a remote name.
+
+    Returns:
+        dict: The "source" section of an instance creation request.
+    """
+    remote, sep, alias = image.partition(":")
+    if sep and remote in IMAGE_REMOTES:
+        return {
+            "type": "image",
+            "alias": alias,
+            "server": IMAGE_REMOTES[remote],
+            "protocol": "simplestreams",
+            "mode": "pull",
+        }
+    return {"type": "image", "alias": image}
+
+
+def _download_to(url, path):
+    """Download a URL into a local file.
+
+    The file is closed (and therefore flushed) before this returns, so it is
+    safe to move or read it straight away.
+
+    Args:
+        url (str): URL to fetch.
+        path (str): Destination file path.
+
+    Raises:
+        subprocess.CalledProcessError: If the download fails.
+    """
+    with open(path, "wb") as fh:
+        subprocess.run(['wget', '-qO', '-', url], stdout=fh, check=True)
 
 
 def write_key_and_move():
@@ -23,10 +317,10 @@ def write_key_and_move():
     temp_key_path = os.path.join(home_dir, 'zabbly.asc')  # <-- Fix: home_dir
     target_dir = '/etc/apt/keyrings'
     target_key_path = os.path.join(target_dir, 'zabbly.asc')
+    os.makedirs(target_dir, exist_ok=True)
 
     # Download the key to the temp location
-    download_cmd = ['wget', '-qO', temp_key_path, 'https://pkgs.zabbly.com/key.asc']
-    subprocess.run(download_cmd, check=True)
+    _download_to('https://pkgs.zabbly.com/key.asc', temp_key_path)
 
     # Move the key to the target directory with sudo
     move_cmd = ['sudo', 'mv', temp_key_path, target_key_path]
@@ -39,52 +333,84 @@ def write_key_and_move():
     print(f'Key downloaded to {temp_key_path} and moved to {target_key_path} with sudo.')
 
 
-def list_containers():
+def _instance_states(names):
+    """Fetch the status of several instances concurrently.
+
+    Args:
+        names (list[str]): Instance names.
+
+    Returns:
+        list[str]: Status of each instance, in the same order; 'unknown' if it could not be read.
+    """
+    def fetch(name):
+        resp = _send("get", f"{BASE_URL}/instances/{name}/state")
+        if resp.status_code == 200:
+            return (_json(resp).get("metadata") or {}).get("status", "unknown")
+        return "unknown"
+
+    with ThreadPoolExecutor(max_workers=STATE_QUERY_WORKERS) as executor:
+        return list(executor.map(fetch, names))
+
+
+def list_containers(filter_expr=None):
     """List all containers and their statuses.
 
+    Args:
+        filter_expr (str, optional): Server-side filter such as 'status eq Running'.
+            Defaults to None (all containers).
+
     Returns:
         list[dict]: A list of dictionaries, each containing 'name' and 'status' of a container.
     Raises:
         Exception: If the API request fails.
     """
-    api_url = f"{BASE_URL}/instances"
-    session = requests_unixsocket.Session()
-    resp = session.get(api_url)
-    if resp.status_code == 200:
-        data = resp.json()
-        containers = []
-        for instance_path in data.get("metadata", []):
-            container_name = instance_path.split('/')[-1]
-            state_url = f"{BASE_URL}/instances/{container_name}/state"
-            state_resp = session.get(state_url)
-            status = "unknown"
-            if state_resp.status_code == 200:
-                state_data = state_resp.json()
-                status = state_data.get("metadata", {}).get("status", "unknown")
-            containers.append({"name": container_name, "status": status})  # <-- Fix: container_name
-        return containers
+    path = _INSTANCES_PATH
+    if filter_expr:
+        path += f"&filter={quote(filter_expr)}"
+    try:
+        status_code, body = _raw_get(path)
+    except (ConnectionError, http.client.RemoteDisconnected):
+        # Only retry when the connection itself failed; a timeout means incusd
+        # is slow, and a second full listing would only add to its load
+        resp = _send("get", f"{SOCKET_URL}{path}")
+        status_code, body = resp.status_code, resp.content
+    if status_code == 200:
+        data = _loads(body)
+        metadata = data.get("metadata", [])
+        if metadata and isinstance(metadata[0], str):
+            # Servers without recursion support only return instance URLs
+            names = [url.rsplit("/", 1)[-1] for url in metadata]
+            return [{"name": name, "status": status} for name, status in zip(names, _instance_states(names))]
+        # Expanded instances carry their status, so one request covers them all
+        return [
+            {
+                "name": instance["name"],
+                "status": instance.get("status") or (instance.get("state") or {}).get("status", "unknown"),
+            }
+            for instance in metadata
+        ]
     else:
-        raise Exception(f"Failed to fetch containers: {resp.status_code} - {resp.text}")
+        raise Exception(f"Failed to fetch containers: {status_code} - {body.decode(errors='replace')}")
 
 
 def toggle_container(container_name, current_status): 
     """Start or stop a container based on its current status.
 
+    Returns once the state change has completed.
+
     Args:
         container_name (str): Name of the container to toggle.
         current_status (str): Current status of the container (e.g., 'running', 'stopped').
 
     Raises:
-        Exception: If the API request fails.
+        Exception: If the API request or the state change fails.
     """
     api_url = f"{BASE_URL}/instances/{container_name}/state"
-    session = requests_unixsocket.Session()
-    if current_status.lower() == "running":
-        resp = session.put(api_url, json={"action": "stop"})
-    else:
-        resp = session.put(api_url, json={"action": "start"})
+    action = "stop" if current_status.lower() == "running" else "start"
+    resp = _send("put", api_url, data=_STATE_CHANGE_BODIES[action], headers=_JSON_HEADERS)
     if resp.status_code not in (200, 202):
         raise Exception(f"Failed to toggle container {container_name}: {resp.status_code}")
+    _wait_for_operation(resp, timeout=STATE_CHANGE_WAIT)
 
 
 def restart_container(container_name):
@@ -97,20 +423,20 @@ def restart_container(container_name):
         Exception: If the API request fails or the container cannot be started.
     """
     api_url = f"{BASE_URL}/instances/{container_name}/state"
-    session = requests_unixsocket.Session()
     # Try to stop the container (ignore if already stopped)
     try:
-        resp = session.put(api_url, json={"action": "stop"})
+        resp = _send("put", api_url, json={"action": "stop"})
         print(f"Stop attempt: {resp.status_code} - {resp.text}")
         if resp.status_code not in (200, 202):
             print(f"Warning: Could not stop container {container_name}: {resp.status_code}")
+        else:
+            # Block until the stop has actually completed before starting again
+            _wait_for_operation(resp, timeout=5)
     except Exception as e:
         print(f"Warning: Exception stopping container {container_name}: {e}")
-    # Small delay to allow state to settle (optional)
-    time.sleep(1)
     # Try to start the container (ignore if already running)
     try:
-        resp = session.put(api_url, json={"action": "start"})
+        resp = _send("put", api_url, json={"action": "start"})
         print(f"Start attempt: {resp.status_code} - {resp.text}")
         if resp.status_code not in (200, 202):
             raise Exception(f"Failed to start container {container_name}: {resp.status_code}")
@@ -128,20 +454,28 @@ def launch_container(name, image, profile=None):
         profile (str, optional): Profile to apply to the container. Defaults to None.
 
     Raises:
-        Exception: If the container launch or profile addition fails.
+        Exception: If the container creation or start fails.
     """
-    cmd_launch = ["incus", "launch", image, name]
-    result = subprocess.run(cmd_launch, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(f"Failed to launch container: {result.stderr or result.stdout}")
+    payload = {
+        "name": name,
+        "source": _image_source(image),
+        "profiles": ["default"] + ([profile] if profile else []),
+        "start": True,
+    }
+    # Not sent through _send(): creating an instance must not be retried blindly
+    resp = _SESSION.post(f"{BASE_URL}/instances", json=payload)
+    if resp.status_code not in (200, 202):
+        raise Exception(f"Failed to launch container: {resp.status_code} - {resp.text}")
+    try:
+        # Image downloads can take a while, so let the server wait indefinitely
+        _wait_for_operation(resp, timeout=-1)
+    except Exception as e:
+        raise Exception(f"Failed to launch container: {e}")
 
-    if profile:
-        cmd_profile_add = ["incus", "profile", "add", name, profile]
-        result = subprocess.run(cmd_profile_add, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"Failed to add profile: {result.stderr or result.stdout}")  # <-- Fix: raise
+    invalidate_profiles_cache()
 
 
+@_ttl_cache(seconds=5)
 def list_profiles():
     """List all available profiles excluding 'default'.
 
@@ -149,61 +483,171 @@ def list_profiles():
         list: List of profile names (excluding 'default').
 
     Raises:
-        Exception: If the profile listing command fails.
+        Exception: If the API request fails.
     """
-    result = subprocess.run(["incus", "profile", "list", "--format", "csv"],
-                            capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(f"Failed to list profiles: {result.stderr or result.stdout}")
+    resp = _send("get", f"{BASE_URL}/profiles")
+    if resp.status_code != 200:
+        raise Exception(f"Failed to list profiles: {resp.status_code} - {resp.text}")
+    names = (unquote(url.rsplit("/", 1)[-1]) for url in _json(resp).get("metadata", []))
+    return [name for name in names if name != "default"]
 
-    profiles = []
-    for line in result.stdout.strip().splitlines()[1:]:  # Skip header
-        if line:
-            profile_name = line.split(',')[0].strip()
-            if profile_name != "default":
-                profiles.append(profile_name)
-    return profiles
+
+def invalidate_profiles_cache():
+    """Forget the cached list_profiles() result.
+
+    Call after anything that may have created, renamed or deleted a profile.
+    """
+    list_profiles.cache_clear()
 
 
-def delete_container(name):
+def delete_container(name, stop=False):
     """Delete an Incus container.
 
     Args:
         name (str): Name of the container to delete.
+        stop (bool, optional): Stop the container first and wait for it to halt
+            before deleting. Defaults to False.
 
     Raises:
-        Exception: If the deletion command fails.
+        Exception: If the stop or deletion request fails.
     """
-    cmd = ["incus", "delete", name]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(f"Failed to delete container: {result.stderr or result.stdout}")
+    if stop:
+        resp = _send("put", f"{BASE_URL}/instances/{name}/state", json={"action": "stop", "force": True})
+        if resp.status_code not in (200, 202):
+            raise Exception(f"Failed to stop container: {resp.status_code} - {resp.text}")
+        try:
+            _wait_for_operation(resp)
+        except Exception as e:
+            raise Exception(f"Failed to stop container: {e}")
+
+    resp = _send("delete", f"{BASE_URL}/instances/{name}")
+    if resp.status_code not in (200, 202):
+        raise Exception(f"Failed to delete container: {resp.status_code} - {resp.text}")
+    try:
+        _wait_for_operation(resp)
+    except Exception as e:
+        raise Exception(f"Failed to delete container: {e}")
+
+
+def open_event_stream(event_types="lifecycle"):
+    """Subscribe to the Incus event feed.
+
+    Args:
+        event_types (str, optional): Comma-separated event types to receive. Defaults to "lifecycle".
+
+    Returns:
+        requests.Response: A streaming response; pass it to iter_events() to read events.
+            Closing it ends the subscription.
+
+    Raises:
+        Exception: If the subscription request fails.
+    """
+    resp = _send("get", f"{BASE_URL}/events?type={quote(event_types)}", stream=True)
+    if resp.status_code != 200:
+        resp.close()
+        raise Exception(f"Failed to subscribe to events: {resp.status_code} - {resp.text}")
+    return resp
+
+
+def interrupt_event_stream(resp):
+    """End an event stream that another thread may be blocked reading.
+
+    Closing the response from a second thread waits for the reader to release
+    the stream's buffer lock, which only happens once an event arrives. Shutting
+    down the socket instead makes the blocked read return at once; the reading
+    thread should then close the response itself.
+
+    Args:
+        resp (requests.Response): A response returned by open_event_stream().
+    """
+    sock = getattr(getattr(resp.raw, "_connection", None), "sock", None)
+    if sock is None:
+        resp.close()
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # Already closed
+
+
+def iter_events(resp):
+    """Yield events from a stream opened by open_event_stream().
+
+    Args:
+        resp (requests.Response): The streaming events response.
+
+    Yields:
+        dict: One decoded event per line sent by the server.
+    """
+    for line in resp.iter_lines():
+        if line:
+            yield _loads(line)
+
+
+# Set once Incus has been found; an installation doesn't disappear while the GUI runs
+_installed = False
 
 
 def is_incus_installed():
     """Check if Incus is installed on the system.
 
+    Incus counts as installed when the incus binary is on PATH and the daemon
+    socket exists. A positive result is remembered for later calls.
+
     Returns:
         bool: True if Incus is installed, False otherwise.
     """
-    return shutil.which('incus') is not None
+    global _installed
+    if not _installed:
+        _installed = shutil.which('incus') is not None and os.path.exists(SOCKET_PATH)
+    return _installed
 
 
-def get_available_incus_versions():
+def _apt_incus_versions():
+    """Return the incus versions known to apt, or an empty list."""
     try:
-        # Try apt (Debian/Ubuntu)
-        result = subprocess.run(['apt-cache', 'madison', 'incus'], capture_output=True, text=True)
+        result = subprocess.run(['apt-cache', 'madison', 'incus'], capture_output=True, text=True,
+                                timeout=VERSION_QUERY_TIMEOUT)
         lines = result.stdout.strip().split('\n')
         if lines and lines[0]:
             return [line.split('|')[1].strip() for line in lines if line]
-        # Try snap
-        result = subprocess.run(['snap', 'find', 'incus'], capture_output=True, text=True)
+    except Exception:
+        pass
+    return []
+
+
+def _snap_incus_versions():
+    """Return the incus packages known to snap, or an empty list."""
+    try:
+        result = subprocess.run(['snap', 'find', 'incus'], capture_output=True, text=True,
+                                timeout=VERSION_QUERY_TIMEOUT)
         lines = result.stdout.strip().split('\n')
         if len(lines) > 1:  # First line is header
             return [line.split()[0] for line in lines[1:] if line]
     except Exception:
         pass
-    return ["incus"]  # Fallback
+    return []
+
+
+@_ttl_cache()
+def get_available_incus_versions():
+    """List installable Incus versions, preferring apt over snap.
+
+    Both package managers are queried concurrently. An apt result is returned
+    as soon as it is available; snap is only waited for when apt has none, so
+    that case doesn't pay for apt and snap in sequence.
+
+    Returns:
+        list: Available versions, or ["incus"] if neither source reports any.
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        apt_future = executor.submit(_apt_incus_versions)
+        snap_future = executor.submit(_snap_incus_versions)
+        return apt_future.result() or snap_future.result() or ["incus"]  # Fallback
+    finally:
+        # Don't wait for a snap query whose result is no longer needed
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def generate_preseed_file(settings, filename="incus-preseed.yaml"):
@@ -217,23 +661,11 @@ def generate_preseed_file(settings, filename="incus-preseed.yaml"):
         str: The path to the generated preseed file.
     """
     with open(filename, "w") as f:
-        f.write(
-            f"config:\n"
-            f"  core.https_address: 0.0.0.0\n"
-            f"  core.trust_password: ''\n"
-            f"storage_pools:\n"
-            f"- name: {settings['storage']}\n"
-            f"  driver: dir\n"
-            f"networks:\n"
-            f"- name: {settings['network']}\n"
-            f"  type: bridge\n"
-            f"  config:\n"
-            f"    ipv4.address: auto\n"
-            f"    ipv6.address: auto\n"
-        )
+        f.write(_PRESEED_TEMPLATE.substitute(storage=settings["storage"], network=settings["network"]))
     return filename
 
 
+@functools.lru_cache(maxsize=1)
 def get_distro_info():
     """Detect the current Linux distribution, version, and codename.
 
@@ -261,6 +693,12 @@ def get_distro_info():
     return distro, version, codename
 
 
+@functools.lru_cache(maxsize=1)
+def _dpkg_arch():
+    """Return the Debian architecture name of this system (e.g. 'amd64')."""
+    return subprocess.check_output(['dpkg', '--print-architecture']).decode().strip()
+
+
 def install_incus(settings):
     """Install Incus on the current system based on user settings.
 
@@ -292,35 +730,27 @@ def install_incus(settings):
             else:
                 # Use Zabbly repository for daily/stable/lts (if user wants)
                 repo_url = f"https://pkgs.zabbly.com/incus/{channel}"
-                os.makedirs("/etc/apt/keyrings", exist_ok=True)
-                #subprocess.run(["wget", "-qO", "-", "https://pkgs.zabbly.com/key.asc"], check=True, stdout=open("/etc/apt/keyrings/zabbly.asc", "wb"))
                 write_key_and_move()
                 sources_file = f"/etc/apt/sources.list.d/zabbly-incus-{channel}.sources"
-                with open(sources_file, "w") as f:
-                    f.write(
-                        f"Enabled: yes\nTypes: deb\nURIs: {repo_url}\nSuites: {codename}\nComponents: main\nArchitectures: {subprocess.check_output(['dpkg', '--print-architecture']).decode().strip()}\nSigned-By: /etc/apt/keyrings/zabbly.asc\n"
-                    )
-                subprocess.run(["sudo", "apt", "update"], check=True)
-                subprocess.run(["sudo", "apt", "install", "-y", "incus"], check=True)
+                Path(sources_file).write_text(
+                    f"Enabled: yes\nTypes: deb\nURIs: {repo_url}\nSuites: {codename}\nComponents: main\nArchitectures: {_dpkg_arch()}\nSigned-By: /etc/apt/keyrings/zabbly.asc\n"
+                )
+                subprocess.run(APT_UPDATE_AND_INSTALL, check=True)
             reboot_required = True
 
         # --- Ubuntu < 24.04 / Debian ---
         elif (distro == "ubuntu" and version and float(version) < 24.04) or (distro == "debian"):
             # Use Zabbly repository
             repo_url = f"https://pkgs.zabbly.com/incus/{channel}"
-            os.makedirs("/etc/apt/keyrings", exist_ok=True)
-            # subprocess.run(["wget", "-qO", "-", "https://pkgs.zabbly.com/key.asc"], check=True, stdout=open("/etc/apt/keyrings/zabbly.asc", "wb"))
             write_key_and_move()
             temp_file = f"zabbly-incus-{channel}.sources"
             sources_file = f"/etc/apt/sources.list.d/zabbly-incus-{channel}.sources"
-            with open(temp_file, "w") as f:
-                f.write(
-                    f"Enabled: yes\nTypes: deb\nURIs: {repo_url}\nSuites: {codename if codename else version}\nComponents: main\nArchitectures: {subprocess.check_output(['dpkg', '--print-architecture']).decode().strip()}\nSigned-By: /etc/apt/keyrings/zabbly.asc\n"
-                )
+            Path(temp_file).write_text(
+                f"Enabled: yes\nTypes: deb\nURIs: {repo_url}\nSuites: {codename if codename else version}\nComponents: main\nArchitectures: {_dpkg_arch()}\nSigned-By: /etc/apt/keyrings/zabbly.asc\n"
+            )
             target_dir = '/etc/apt/sources.list.d'
             subprocess.run(["sudo", "mv", temp_file, target_dir], check=True)
-            subprocess.run(["sudo", "apt", "update"], check=True)
-            subprocess.run(["sudo", "apt", "install", "-y", "incus"], check=True)
+            subprocess.run(APT_UPDATE_AND_INSTALL, check=True)
             reboot_required = True
 
         # --- Other distros (Fedora, Arch, Rocky, Gentoo) ---
@@ -341,6 +771,8 @@ def install_incus(settings):
             subprocess.run(["sudo", "usermod", "-aG", "incus-admin", user], check=True)
             reboot_required = True
 
+        invalidate_profiles_cache()
+        get_available_incus_versions.cache_clear()
         return reboot_required
 
     except Exception as e:
@@ -20,6 +20,22 @@ class InstallThread(QThread):
         super().__init__(parent)
         self.settings = settings
 
+    def _run_streaming(self, cmd, step):
+        """Run a command, forwarding each line of its output as progress.
+
+        Args:
+            cmd (list): Command and arguments to execute.
+            step (int): Progress step reported alongside each output line.
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits with a non-zero status.
+        """
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        for line in process.stdout:
+            self.progress.emit(step, line.rstrip())
+        if process.wait():
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
     def run(self):
         try:
             # Step 1: Add Zabbly key and repo (if needed)
@@ -28,23 +44,23 @@ class InstallThread(QThread):
 
             # Step 2: Update package list and install Incus
             self.progress.emit(2, "Updating package list...")
-            subprocess.run(["sudo", "apt", "update"], check=True)
+            self._run_streaming(["sudo", "apt", "update"], 2)
             self.progress.emit(3, "Installing Incus...")
-            subprocess.run(["sudo", "apt", "install", "-y", "incus"], check=True)
+            self._run_streaming(["sudo", "apt", "install", "-y", "incus"], 3)
 
             # Step 3: Add user to incus-admin group
             self.progress.emit(4, "Adding user to incus-admin group...")
             user = os.getenv("USER")
-            subprocess.run(["sudo", "adduser", user, "incus-admin"], check=True)
+            self._run_streaming(["sudo", "adduser", user, "incus-admin"], 4)
 
             # Step 4: Create storage pool (if not exists)
             self.progress.emit(5, "Creating storage pool...")
             try:
-                subprocess.run(["sudo","incus", "storage", "create", "default", "dir"], check=True)
+                self._run_streaming(["sudo","incus", "storage", "create", "default", "dir"], 5)
                 #subprocess.run(["sudo","incus", "storage", "list"], check=True, capture_output=True)
             except subprocess.CalledProcessError:
                 # If storage list fails, assume no pool exists
-                subprocess.run(["sudo","incus", "storage", "create", "default", "dir"], check=True)
+                self._run_streaming(["sudo","incus", "storage", "create", "default", "dir"], 5)
 
             # Step 5: Create network bridge (if not exists)
             self.progress.emit(6, "Creating network bridge...")
@@ -52,7 +68,7 @@ class InstallThread(QThread):
                 subprocess.run(["sudo","incus", "network", "show", "incusbr0"], check=True, capture_output=True)
             except subprocess.CalledProcessError:
                 # If network show fails, assume bridge does not exist
-                subprocess.run(["sudo","incus", "network", "create", "incusbr0", "--type=bridge"], check=True)
+                self._run_streaming(["sudo","incus", "network", "create", "incusbr0", "--type=bridge"], 6)
 
             # Step 6: Update default profile
             self.progress.emit(7, "Updating default profile...")
@@ -101,7 +117,10 @@ class InstallWizard(QDialog):
 
         # Version selection
         self.version_combo = QComboBox()
+        # Version lists can be long; skip per-item change notifications while filling
+        self.version_combo.blockSignals(True)
         self.version_combo.addItems(available_versions)
+        self.version_combo.blockSignals(False)
         layout.addWidget(QLabel("Select Incus Version:"))
         layout.addWidget(self.version_combo)
 
@@ -43,7 +43,6 @@ class LaunchContainerDialog(QDialog):
         image_layout = QHBoxLayout()
         image_label = QLabel("Image:")
         self.image_combo = QComboBox()
-        self.image_combo.addItems(images)
         image_layout.addWidget(image_label)
         image_layout.addWidget(self.image_combo)
         layout.addLayout(image_layout)
@@ -52,8 +51,6 @@ class LaunchContainerDialog(QDialog):
         profile_layout = QHBoxLayout()
         profile_label = QLabel("Profile:")
         self.profile_combo = QComboBox()
-        self.profile_combo.addItem("None")
-        self.profile_combo.addItems(profiles)
         profile_layout.addWidget(profile_label)
         profile_layout.addWidget(self.profile_combo)
         layout.addLayout(profile_layout)
@@ -70,6 +67,25 @@ class LaunchContainerDialog(QDialog):
         self.launch_btn.clicked.connect(self.on_launch)
         self.cancel_btn.clicked.connect(self.reject)
 
+        self.set_choices(images, profiles)
+
+    def set_choices(self, images, profiles):
+        """Replace the available images and profiles and clear the name field.
+
+        Lets the dialog be reused across launches instead of being rebuilt.
+
+        Args:
+            images (list): List of available container images.
+            profiles (list): List of available profiles (excluding 'default').
+        """
+        self.name_edit.clear()
+        # Lists can be long; skip per-item change notifications while refilling
+        for combo, items in ((self.image_combo, images), (self.profile_combo, ["None"] + list(profiles))):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(items)
+            combo.blockSignals(False)
+
     def on_launch(self):
         """Handle the launch button click.
 
@@ -6,13 +6,17 @@ is already present), it starts the main GUI window.
 """
 
 import sys
-from incus_gui.incus_operations import is_incus_installed, get_available_incus_versions, generate_preseed_file, install_incus
+import threading
+from incus_gui.incus_operations import is_incus_installed, get_available_incus_versions, generate_preseed_file, install_incus, prewarm_connections
 from incus_gui.install_wizard import InstallWizard
 from incus_gui.main_window import IncusGui
 from PySide6.QtWidgets import QApplication, QMessageBox, QDialog  # <-- Fix: QMessageBox
 
 app = QApplication(sys.argv)
 
+# Connect to the Incus socket while the wizard or main window is being set up
+threading.Thread(target=prewarm_connections, daemon=True).start()
+
 if not is_incus_installed():
     versions = get_available_incus_versions()
     # Always launch the wizard, even if no versions are found
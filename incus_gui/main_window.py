@@ -5,13 +5,409 @@ including listing, starting, stopping, restarting, and deleting containers,
 as well as launching new containers and handling user interactions.
 """
 
+import threading
 from PySide6.QtWidgets import (
-    QMainWindow, QVBoxLayout, QWidget, QListWidget, QListWidgetItem,
-    QPushButton, QLabel, QHBoxLayout, QMessageBox, QDialog
+    QMainWindow, QVBoxLayout, QWidget, QListView, QPushButton, QHBoxLayout,
+    QMessageBox, QDialog, QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, QThread, Signal,
+    QAbstractListModel, QModelIndex, QEvent, QRect, QSize
+)
+from PySide6.QtGui import QColor, QPainter
 from incus_gui.launch_dialog import LaunchContainerDialog
-from incus_gui.incus_operations import list_containers, toggle_container, restart_container, launch_container, list_profiles, delete_container
+from incus_gui.incus_operations import list_containers, toggle_container, restart_container, launch_container, list_profiles, delete_container, open_event_stream, iter_events, interrupt_event_stream
+
+# Status box fill colours, one per state a row can be drawn in
+_STATUS_COLORS = {
+    "running": QColor("green"),
+    "stopped": QColor("red"),
+    "busy": QColor("yellow"),
+    "unknown": QColor("gray"),
+}
+_STATUS_BORDER = QColor("#666")
+
+# Minimum interval between two container list fetches, in milliseconds
+_REFRESH_INTERVAL_MS = 250
+
+# Container operations run concurrently; each may block its thread until done
+_ACTION_WORKERS = 4
+
+# Delay before resubscribing to a dropped event stream, doubled after each
+# failed attempt up to the maximum, in milliseconds
+_EVENTS_RETRY_MIN_MS = 5000
+_EVENTS_RETRY_MAX_MS = 60000
+
+
+# Container status implied by each instance lifecycle action; "deleted" removes the row
+_LIFECYCLE_STATUS = {
+    "instance-created": "Stopped",
+    "instance-started": "Running",
+    "instance-restarted": "Running",
+    "instance-resumed": "Running",
+    "instance-stopped": "Stopped",
+    "instance-shutdown": "Stopped",
+    "instance-paused": "Frozen",
+    "instance-deleted": "deleted",
+}
+
+
+def container_update_from_event(event):
+    """Work out which container an Incus event concerns and its new status.
+
+    Args:
+        event (dict): Event as received from the Incus event stream.
+
+    Returns:
+        tuple | None: (name, status) for instance lifecycle events, where status is
+            empty if the action doesn't imply one; None for any other event.
+    """
+    metadata = event.get("metadata") or {}
+    action = metadata.get("action", "")
+    if event.get("type") != "lifecycle" or not action.startswith("instance-"):
+        return None
+    name = metadata.get("source", "").split("?")[0].rsplit("/", 1)[-1]
+    return name, _LIFECYCLE_STATUS.get(action, "")
+
+
+def _running_first(names, statuses, busy):
+    """Order container columns running first, otherwise keeping their order.
+
+    Args:
+        names (list[str]): Container names.
+        statuses (list[str]): Status of each container.
+        busy (bytes): Busy flag (0 or 1) of each container.
+
+    Returns:
+        tuple: (names, statuses, busy) reordered the same way.
+    """
+    # sorted() is stable, so the given order is kept within each group
+    order = sorted(range(len(names)), key=lambda i: statuses[i].lower() != "running")
+    return [names[i] for i in order], [statuses[i] for i in order], bytes(busy[i] for i in order)
+
+
+class ContainerListModel(QAbstractListModel):
+    """List model of containers, stored as parallel name, status and busy columns.
+
+    The container name is the DisplayRole data of a row. Keeping the columns
+    as flat lists (and a bytearray for the busy flags) lets a refresh compare
+    whole columns at once instead of building and comparing a dict per row.
+    """
+    StatusRole = Qt.UserRole
+    BusyRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._statuses = []
+        self._busy = bytearray()
+        self._positions = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        position = index.row()
+        if role == Qt.DisplayRole:
+            return self._names[position]
+        if role == self.StatusRole:
+            return self._statuses[position]
+        if role == self.BusyRole:
+            return bool(self._busy[position])
+        return None
+
+    def columns(self):
+        """Return copies of the (names, statuses, busy) columns in display order."""
+        return list(self._names), list(self._statuses), bytes(self._busy)
+
+    def rows(self):
+        """Return the rows as {name, status, busy} dicts in display order."""
+        return [
+            {"name": name, "status": status, "busy": bool(busy)}
+            for name, status, busy in zip(self._names, self._statuses, self._busy)
+        ]
+
+    def status(self, name):
+        """Return a container's current status, or None if it has no row."""
+        position = self._positions.get(name)
+        return None if position is None else self._statuses[position]
+
+    def set_columns(self, names, statuses, busy):
+        """Replace the contents of the model with as few signals as possible.
+
+        If the same containers are listed in the same order, a single dataChanged
+        covers the rows that changed; if only the order differs, the rows are
+        moved with one layout change; otherwise the model is reset.
+
+        Args:
+            names (list[str]): Container names in display order.
+            statuses (list[str]): Status of each container.
+            busy (bytes): Busy flag (0 or 1) of each container.
+        """
+        busy = bytearray(busy)
+        old_names = self._names
+        if names == old_names:
+            if statuses == self._statuses and busy == self._busy:
+                return
+            old_statuses, old_busy = self._statuses, self._busy
+            changed = [
+                position for position in range(len(names))
+                if statuses[position] != old_statuses[position] or busy[position] != old_busy[position]
+            ]
+            self._statuses = list(statuses)
+            self._busy = busy
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+            return
+        if len(names) == len(old_names) and set(names) == self._positions.keys():
+            self.layoutAboutToBeChanged.emit()
+            self._names, self._statuses, self._busy = list(names), list(statuses), busy
+            self._positions = {name: position for position, name in enumerate(names)}
+            persistent = self.persistentIndexList()
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(self._positions[old_names[index.row()]]) for index in persistent],
+            )
+            self.layoutChanged.emit()
+            return
+        self.beginResetModel()
+        self._names, self._statuses, self._busy = list(names), list(statuses), busy
+        self._positions = {name: position for position, name in enumerate(names)}
+        self.endResetModel()
+
+    def update_row(self, name, status=None, busy=None):
+        """Change the status and/or busy flag of one container's row.
+
+        Args:
+            name (str): Name of the container.
+            status (str, optional): New status; unchanged if None.
+            busy (bool, optional): New busy flag; unchanged if None.
+
+        Returns:
+            bool: False if no row exists for the container.
+        """
+        position = self._positions.get(name)
+        if position is None:
+            return False
+        changed = False
+        if status is not None and self._statuses[position] != status:
+            self._statuses[position] = status
+            changed = True
+        if busy is not None and self._busy[position] != busy:
+            self._busy[position] = busy
+            changed = True
+        if changed:
+            index = self.index(position)
+            self.dataChanged.emit(index, index)
+        return True
+
+    def remove_row(self, name):
+        """Remove a container's row, if present.
+
+        Args:
+            name (str): Name of the container.
+        """
+        position = self._positions.get(name)
+        if position is None:
+            return
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._names[position]
+        del self._statuses[position]
+        del self._busy[position]
+        self._positions = {name: position for position, name in enumerate(self._names)}
+        self.endRemoveRows()
+
+
+class ContainerDelegate(QStyledItemDelegate):
+    """Paint container rows (name, status box and action buttons) without widgets.
+
+    Emits ``button_clicked`` with the container name and the button's action
+    ("toggle", "restart" or "delete") when a button is clicked. Clicks on a
+    busy row are ignored.
+    """
+    button_clicked = Signal(str, str)
+
+    ROW_HEIGHT = 40
+    BOX_SIZE = 24
+    BUTTON_WIDTH = 72
+    SPACING = 6
+
+    def button_rects(self, rect):
+        """Return the (action, rect) pairs of a row's buttons, left to right.
+
+        Args:
+            rect (QRect): Rectangle of the row.
+        """
+        buttons = []
+        right = rect.right() - self.SPACING
+        for action in ("delete", "restart", "toggle"):
+            button = QRect(right - self.BUTTON_WIDTH + 1, rect.top() + self.SPACING,
+                           self.BUTTON_WIDTH, rect.height() - 2 * self.SPACING)
+            buttons.insert(0, (action, button))
+            right = button.left() - self.SPACING
+        return buttons
+
+    def paint(self, painter, option, index):
+        status = index.data(ContainerListModel.StatusRole)
+        busy = index.data(ContainerListModel.BusyRole)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+
+        buttons = self.button_rects(option.rect)
+        box_right = buttons[0][1].left() - self.SPACING
+        box = QRect(box_right - self.BOX_SIZE + 1, option.rect.center().y() - self.BOX_SIZE // 2,
+                    self.BOX_SIZE, self.BOX_SIZE)
+        text_rect = QRect(option.rect.left() + self.SPACING, option.rect.top(),
+                          box.left() - option.rect.left() - 2 * self.SPACING, option.rect.height())
+
+        status = status.lower()
+        key = "busy" if busy else status if status in ("running", "stopped") else "unknown"
+        selected = option.state & QStyle.State_Selected
+        painter.save()
+        painter.setPen(option.palette.highlightedText().color() if selected else option.palette.text().color())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         option.fontMetrics.elidedText(index.data(), Qt.ElideRight, text_rect.width()))
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(_STATUS_BORDER)
+        painter.setBrush(_STATUS_COLORS[key])
+        painter.drawRoundedRect(box.adjusted(0, 0, -1, -1), 3, 3)
+        painter.restore()
+
+        labels = {"toggle": "Stop" if status == "running" else "Start", "restart": "Restart", "delete": "Delete"}
+        for action, rect in buttons:
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = labels[action]
+            button.palette = option.palette
+            button.state = QStyle.State_Raised if busy else QStyle.State_Raised | QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, button, painter, widget)
+
+    def sizeHint(self, option, index):
+        return QSize(super().sizeHint(option, index).width(), self.ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if (index.data(ContainerListModel.BusyRole)
+                or event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton):
+            return super().editorEvent(event, model, option, index)
+        point = event.position().toPoint()
+        for action, rect in self.button_rects(option.rect):
+            if rect.contains(point):
+                self.button_clicked.emit(index.data(), action)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by pool workers (a QRunnable cannot emit on its own)."""
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class ListContainersWorker(QRunnable):
+    """Fetch the container list on a QThreadPool thread.
+
+    Emits ``signals.finished`` with the list returned by ``list_containers`` or
+    ``signals.error`` with the exception message if the fetch fails.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(list_containers())
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class ContainerActionWorker(QRunnable):
+    """Run an operation on one container on a QThreadPool thread.
+
+    Emits ``signals.error`` with a description of the failure if the operation
+    raises, then ``signals.finished`` with the container name in either case.
+    The exception message is also kept in ``failure`` (None on success).
+    """
+
+    def __init__(self, description, action, container_name, *args):
+        """Initialize the worker.
+
+        Args:
+            description (str): What the operation does, used in error messages.
+            action (callable): Operation to run; called as action(container_name, *args).
+            container_name (str): Name of the container.
+            *args: Further arguments for the operation.
+        """
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.description = description
+        self.action = action
+        self.container_name = container_name
+        self.args = args
+        self.failure = None
+
+    def run(self):
+        try:
+            self.action(self.container_name, *self.args)
+        except Exception as e:
+            self.failure = str(e)
+            self.signals.error.emit(f"Exception during {self.description} of {self.container_name}: {e}")
+        self.signals.finished.emit(self.container_name)
+
+
+class EventsThread(QThread):
+    """Relay Incus lifecycle events to the GUI thread.
+
+    Emits ``connected`` once the stream is open, then ``container_event`` with
+    the container name and its new status (see container_update_from_event())
+    for every instance lifecycle event. The thread finishes when the stream
+    fails or is closed with ``stop()``; it can be started again to resubscribe.
+    """
+    connected = Signal()
+    container_event = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.response = None
+        self._stopping = False
+        # Guards response/_stopping, which are set from both threads
+        self._lock = threading.Lock()
+
+    def run(self):
+        try:
+            response = open_event_stream()
+            with self._lock:
+                if self._stopping:
+                    response.close()
+                    return
+                self.response = response
+            self.connected.emit()
+            try:
+                for event in iter_events(response):
+                    update = container_update_from_event(event)
+                    if update is not None:
+                        self.container_event.emit(*update)
+            finally:
+                with self._lock:
+                    self.response = None
+                response.close()
+        except Exception as e:
+            if not self._stopping:
+                print(f"Event stream stopped: {e}")
+
+    def stop(self):
+        """End the event stream and wait for the thread to exit."""
+        with self._lock:
+            self._stopping = True
+            response = self.response
+        if response is not None:
+            interrupt_event_stream(response)
+        self.wait()
+
 
 class IncusGui(QMainWindow):
     """Main window for the Incus Container Manager GUI.
@@ -26,8 +422,25 @@ class IncusGui(QMainWindow):
         super().__init__()
         self.setWindowTitle("Incus Container Manager (Qt 6)")
         self.setGeometry(100, 100, 600, 400)
-        self.toggling_container = None
-        self.restarting_container = None
+        # Workers of the container operations in progress, keyed by container name
+        self._actions = {}
+        self._pool = QThreadPool.globalInstance()
+        # Operations block until Incus finishes them, so they get their own pool
+        # rather than delaying refreshes queued on the global one
+        self._action_pool = QThreadPool(self)
+        self._action_pool.setMaxThreadCount(_ACTION_WORKERS)
+        self._inflight = False
+        self._refresh_worker = None
+        # Refreshes requested within _REFRESH_INTERVAL_MS of the last fetch are
+        # folded into a single fetch once the interval has passed
+        self._refresh_pending = False
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(_REFRESH_INTERVAL_MS)
+        self._refresh_debounce.timeout.connect(self._flush_refresh)
+        # Message of the last failed fetch, so an ongoing outage is reported once
+        self._last_error = None
+        self._launch_dlg = None
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -48,121 +461,241 @@ class IncusGui(QMainWindow):
         self.launch_btn.clicked.connect(self.show_launch_dialog)
         top_layout.addWidget(self.launch_btn)
 
-        # Container list
-        self.container_list = QListWidget()
+        # Container list; rows are painted by the delegate, so only visible rows cost anything
+        self.container_model = ContainerListModel(self)
+        self.container_delegate = ContainerDelegate(self)
+        # Queued so the model isn't changed while the view is still handling the click
+        self.container_delegate.button_clicked.connect(self._on_row_button, Qt.QueuedConnection)
+        self.container_list = QListView()
+        self.container_list.setUniformItemSizes(True)
+        self.container_list.setModel(self.container_model)
+        self.container_list.setItemDelegate(self.container_delegate)
         main_layout.addWidget(self.container_list)
 
-        # Auto-refresh timer
+        # Slow keepalive poll; the event stream delivers changes in between
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh_containers)
-        self.timer.start(5000)  # Refresh every 5 seconds
+        self.timer.start(30000)
+
+        # Update rows as Incus reports lifecycle changes
+        self.events_thread = EventsThread(self)
+        self.events_thread.container_event.connect(self._apply_single_update)
+        self.events_thread.connected.connect(self.events_connected)
+        self.events_thread.finished.connect(self.events_stopped)
+        self.events_thread.start()
 
-        self.refresh_containers()
+        # Resubscribes after the stream drops, e.g. when incusd restarts
+        self._events_lost = False
+        self._events_retry_ms = _EVENTS_RETRY_MIN_MS
+        self._events_retry = QTimer(self)
+        self._events_retry.setSingleShot(True)
+        self._events_retry.timeout.connect(self.events_thread.start)
+
+        # Fetch once the event loop runs so the window is painted first
+        QTimer.singleShot(0, self.refresh_containers)
 
     def refresh_containers(self):
         """Refresh the list of containers displayed in the GUI.
 
-        Fetches the current list of containers and updates the UI. Displays errors
-        if the fetch fails.
+        Starts a background fetch of the current list of containers; the UI is
+        updated once the results arrive. Requests made while a fetch is running
+        or less than _REFRESH_INTERVAL_MS after the last one started are
+        coalesced into one follow-up fetch.
         """
-        self.container_list.clear()
-        try:
-            for container in list_containers():
-                self.add_container_item(container["name"], container["status"])
-        except Exception as ex:
-            print(f"Exception in refresh_containers: {ex}")
-            self.container_list.addItem(f"Exception: {str(ex)}")
+        self._refresh_pending = True
+        self._flush_refresh()
 
-    def add_container_item(self, container_name, status):
-        """Add a container item widget to the list.
+    def _flush_refresh(self):
+        """Start a pending refresh unless a fetch is running or was just started."""
+        if self._refresh_pending and not self._inflight and not self._refresh_debounce.isActive():
+            self._do_refresh()
+
+    def _do_refresh(self):
+        """Start a background fetch of the container list."""
+        self._refresh_pending = False
+        self._inflight = True
+        self._refresh_debounce.start()
+        self._refresh_worker = ListContainersWorker()
+        self._refresh_worker.signals.finished.connect(self._apply_container_list)
+        self._refresh_worker.signals.error.connect(self._refresh_failed)
+        self._pool.start(self._refresh_worker)
+
+    def _apply_container_list(self, containers):
+        """Show the result of a background fetch."""
+        self._inflight = False
+        if self._last_error is not None:
+            self._last_error = None
+            self.statusBar().clearMessage()
+        self.populate_containers(containers)
+        self._flush_refresh()
+
+    def _refresh_failed(self, message):
+        """Show the error of a failed background fetch."""
+        self._inflight = False
+        self.show_refresh_error(message)
+        self._flush_refresh()
+
+    def populate_containers(self, containers):
+        """Update the displayed containers to match a freshly fetched list.
+
+        Only rows whose container changed state are repainted as long as the
+        same containers are listed in the same order.
+
+        Args:
+            containers (list[dict]): Containers as returned by list_containers().
+        """
+        names = [c["name"] for c in containers]
+        statuses = [c["status"] for c in containers]
+        actions = self._actions
+        busy = bytes(name in actions for name in names)
+        # The view batches repaints for the model's signals into its next paint event
+        self.container_model.set_columns(*_running_first(names, statuses, busy))
+
+    def _apply_single_update(self, container_name, status):
+        """Apply a status change for one container without refetching the list.
 
         Args:
             container_name (str): Name of the container.
-            status (str): Current status of the container.
-        """
-        item = QListWidgetItem()
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-
-        label = QLabel(container_name)
-        item_layout.addWidget(label)
-
-        status_box = QWidget()
-        status_box.setFixedSize(24, 24)
-        if self.toggling_container == container_name or self.restarting_container == container_name:
-            status_box.setStyleSheet("background: yellow; border: 1px solid #666; border-radius: 3px;")
-        elif status.lower() == "running":
-            status_box.setStyleSheet("background: green; border: 1px solid #666; border-radius: 3px;")
-        elif status.lower() == "stopped":
-            status_box.setStyleSheet("background: red; border: 1px solid #666; border-radius: 3px;")
-        else:
-            status_box.setStyleSheet("background: gray; border: 1px solid #666; border-radius: 3px;")
-        item_layout.addWidget(status_box)
+            status (str): New status, "deleted" if the container is gone, or
+                empty if unknown (the whole list is refreshed instead).
+        """
+        if status == "deleted":
+            self.container_model.remove_row(container_name)
+            return
+        if not status or not self.container_model.update_row(container_name, status=status):
+            self.refresh_containers()
+            return
+        self.container_model.set_columns(*_running_first(*self.container_model.columns()))
 
-        toggle_btn = QPushButton()
-        if status.lower() == "running":
-            toggle_btn.setText("Stop")
-        else:
-            toggle_btn.setText("Start")
-        toggle_btn.setEnabled(self.toggling_container != container_name and self.restarting_container != container_name)
-        toggle_btn.clicked.connect(
-            lambda checked, name=container_name, current_status=status:
-                self.toggle_container(name, current_status)
-        )
-        item_layout.addWidget(toggle_btn)
+    def show_refresh_error(self, message):
+        """Report a failed container fetch in the status bar.
 
-        restart_btn = QPushButton("Restart")
-        restart_btn.setEnabled(self.toggling_container != container_name and self.restarting_container != container_name)
-        restart_btn.clicked.connect(
-            lambda checked, name=container_name:
-                self.restart_container(name)
-        )
-        item_layout.addWidget(restart_btn)
+        The message stays until the next successful fetch. Repeats of the
+        previous error are ignored, so a lasting outage is reported once.
 
-        delete_btn = QPushButton("Delete")
-        delete_btn.setEnabled(self.toggling_container != container_name and self.restarting_container != container_name)
-        delete_btn.clicked.connect(
-            lambda checked, name=container_name, current_status=status:
-                self.confirm_delete_container(name, current_status)
-        )
-        item_layout.addWidget(delete_btn)
+        Args:
+            message (str): The exception message raised by the fetch.
+        """
+        message = message[:200]
+        if message == self._last_error:
+            return
+        self._last_error = message
+        print(f"Failed to refresh containers: {message}")
+        self.statusBar().showMessage(f"Exception: {message}")
+
+    def events_connected(self):
+        """Return to the slow keepalive poll once the event stream is open."""
+        self.timer.start(30000)
+        self._events_retry_ms = _EVENTS_RETRY_MIN_MS
+        if self._events_lost:
+            # Changes made while unsubscribed were never reported
+            self._events_lost = False
+            self.refresh_containers()
+
+    def events_stopped(self):
+        """Poll every 5 seconds once the event stream ends, and resubscribe later.
+
+        The delay before resubscribing doubles with each failed attempt, up to
+        _EVENTS_RETRY_MAX_MS.
+        """
+        self._events_lost = True
+        self.timer.start(5000)
+        self._events_retry.start(self._events_retry_ms)
+        self._events_retry_ms = min(self._events_retry_ms * 2, _EVENTS_RETRY_MAX_MS)
+
+    def _refresh_if_not_streaming(self):
+        """Refresh the list unless the event stream will report the change."""
+        if not self.events_thread.isRunning():
+            self.refresh_containers()
+
+    def closeEvent(self, event):
+        """Stop the event stream before the window closes."""
+        self._events_retry.stop()
+        self.events_thread.blockSignals(True)
+        self.events_thread.stop()
+        super().closeEvent(event)
+
+    def _on_row_button(self, container_name, action):
+        """Dispatch a click on one of a row's buttons.
+
+        Args:
+            container_name (str): Name of the container the row shows.
+            action (str): "toggle", "restart" or "delete".
+        """
+        status = self.container_model.status(container_name)
+        if status is None:
+            return  # Removed since the click
+        if action == "toggle":
+            self.toggle_container(container_name, status)
+        elif action == "restart":
+            self.restart_container(container_name)
+        elif action == "delete":
+            self.confirm_delete_container(container_name, status)
+
+    def _is_busy(self, container_name):
+        """Return whether an action on the container is in progress."""
+        return container_name in self._actions
+
+    def _redraw_row(self, container_name):
+        """Redraw a container's row after its busy state changed.
 
-        self.container_list.addItem(item)
-        item.setSizeHint(item_widget.sizeHint())
-        self.container_list.setItemWidget(item, item_widget)
+        Args:
+            container_name (str): Name of the container.
+        """
+        self.container_model.update_row(container_name, busy=self._is_busy(container_name))
 
     def toggle_container(self, container_name, current_status):
-        """Toggle the state of a container (start/stop).
+        """Toggle the state of a container (start/stop) in the background.
 
         Args:
             container_name (str): Name of the container to toggle.
             current_status (str): Current status of the container.
         """
-        try:
-            self.toggling_container = container_name
-            self.refresh_containers()
-            toggle_container(container_name, current_status)
-        except Exception as e:
-            print(f"Exception during toggle of {container_name}: {e}")
-        finally:
-            self.toggling_container = None
-            self.refresh_containers()
+        self._start_action("toggle", toggle_container, container_name, current_status)
 
     def restart_container(self, container_name):
-        """Restart a container (stop, then start).
+        """Restart a container (stop, then start) in the background.
 
         Args:
             container_name (str): Name of the container to restart.
         """
-        try:
-            self.restarting_container = container_name
-            self.refresh_containers()
-            restart_container(container_name)
-        except Exception as e:
-            print(f"Exception during restart of {container_name}: {e}")
-        finally:
-            self.restarting_container = None
-            self.refresh_containers()
+        self._start_action("restart", restart_container, container_name)
+
+    def _start_action(self, description, action, container_name, *args):
+        """Mark a container busy and run an operation on it on the thread pool.
+
+        Args:
+            description (str): What the operation does, used in error messages.
+            action (callable): Operation from incus_operations to run.
+            container_name (str): Name of the container.
+            *args: Further arguments for the operation.
+        """
+        if container_name in self._actions:
+            return
+        worker = ContainerActionWorker(description, action, container_name, *args)
+        worker.signals.error.connect(self._action_failed)
+        worker.signals.finished.connect(self._action_finished)
+        self._actions[container_name] = worker
+        self._redraw_row(container_name)
+        self._action_pool.start(worker)
+
+    def _action_failed(self, message):
+        """Report a failed container operation."""
+        print(message)
+
+    def _action_finished(self, container_name):
+        """Clear a container's busy state once its operation has returned.
+
+        A successfully deleted container's row is removed instead.
+        """
+        worker = self._actions.pop(container_name, None)
+        if worker is not None and worker.description == "delete":
+            if worker.failure is None:
+                self._apply_single_update(container_name, "deleted")
+                return
+            QMessageBox.warning(self, "Error", f"Failed to delete container: {worker.failure}")
+        self._redraw_row(container_name)
+        self._refresh_if_not_streaming()
 
     def confirm_delete_container(self, container_name, current_status):
         """Confirm and handle container deletion, with optional stop if running.
@@ -171,6 +704,7 @@ class IncusGui(QMainWindow):
             container_name (str): Name of the container to delete.
             current_status (str): Current status of the container.
         """
+        stop_first = False
         if current_status.lower() == "running":
             reply = QMessageBox.question(
                 self,
@@ -181,12 +715,7 @@ class IncusGui(QMainWindow):
             )
             if reply == QMessageBox.Cancel:
                 return
-            elif reply == QMessageBox.Yes:
-                try:
-                    toggle_container(container_name, "running")
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to stop container: {e}")
-                    return
+            stop_first = reply == QMessageBox.Yes
         reply = QMessageBox.question(
             self,
             "Delete Container",
@@ -195,11 +724,7 @@ class IncusGui(QMainWindow):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            try:
-                delete_container(container_name)
-                self.refresh_containers()
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to delete container: {e}")
+            self._start_action("delete", delete_container, container_name, stop_first)
 
     def show_launch_dialog(self):
         """Show the dialog for launching a new container.
@@ -209,7 +734,11 @@ class IncusGui(QMainWindow):
         """
         images = ["images:ubuntu/24.04", "images:ubuntu/22.04", "images:alpine/edge"]
         profiles = list_profiles()  # Excludes 'default'
-        dialog = LaunchContainerDialog(images, profiles, self)
+        if self._launch_dlg is None:
+            self._launch_dlg = LaunchContainerDialog(images, profiles, self)
+        else:
+            self._launch_dlg.set_choices(images, profiles)
+        dialog = self._launch_dlg
         if dialog.exec() == QDialog.Accepted:
             try:
                 launch_container(
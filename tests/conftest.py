@@ -0,0 +1,9 @@
+import pytest
+from unittest.mock import patch
+
+@pytest.fixture(autouse=True)
+def no_incus_socket():
+    """Keep IncusGui from fetching containers or events from a real Incus socket"""
+    with patch('incus_gui.main_window.list_containers', return_value=[]) as mock_list, \
+            patch('incus_gui.main_window.EventsThread.start'):
+        yield mock_list
@@ -1,41 +1,231 @@
+import json
+import os
+import socket
+import threading
+import time
+import tempfile
 import unittest
+import requests
 from unittest.mock import patch, MagicMock, call
-from incus_gui.incus_operations import list_containers, launch_container, delete_container,toggle_container,list_profiles
+from urllib.parse import quote
+from incus_gui.incus_operations import list_containers, launch_container, delete_container,toggle_container,restart_container,list_profiles,generate_preseed_file,get_available_incus_versions,iter_events,_SocketAdapter,invalidate_profiles_cache,is_incus_installed,interrupt_event_stream,_SESSION,_send
 
 class TestIncusOperations(unittest.TestCase):
-    @patch('incus_gui.incus_operations.subprocess.run')
-    def test_launch_container_success(self, mock_run):
-        mock_run.return_value.returncode = 0
-        launch_container('test', 'ubuntu/24.04', 'profile')
-        self.assertEqual(mock_run.call_count, 2)
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_launch_container_success(self, mock_session):
+        mock_session.post.return_value.status_code = 202
+        mock_session.post.return_value.content = json.dumps({"operation": "/1.0/operations/1"}).encode()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Success"}}).encode()
+        launch_container('test', 'images:ubuntu/24.04', 'profile')
+        payload = mock_session.post.call_args.kwargs["json"]
+        self.assertEqual(payload["profiles"], ["default", "profile"])
+        self.assertEqual(payload["source"]["alias"], "ubuntu/24.04")
+        mock_session.get.assert_called_once()
 
-    @patch('incus_gui.incus_operations.requests_unixsocket.Session')
-    def test_list_containers_success(self, mock_session):
+    @patch('incus_gui.incus_operations._SESSION')
+    @patch('incus_gui.incus_operations._raw_get', side_effect=ConnectionResetError("reset"))
+    def test_list_containers_success(self, mock_raw_get, mock_session):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {"metadata": {"status": "running"}}
-        mock_session.return_value.get.side_effect = [mock_resp, mock_resp]
+        mock_resp.content = b'{"metadata": [{"name": "test", "status": "Running"}, {"name": "other", "state": {"status": "Stopped"}}]}'
+        mock_session.get.return_value = mock_resp
         containers = list_containers()
-        self.assertEqual(len(containers), 1)
+        self.assertEqual(containers, [{"name": "test", "status": "Running"}, {"name": "other", "status": "Stopped"}])
+        mock_session.get.assert_called_once()
 
-    @patch('incus_gui.incus_operations.subprocess.run')
-    def test_delete_container_success(self, mock_run):
-        mock_run.return_value.returncode = 0
+    @patch('incus_gui.incus_operations._SESSION')
+    @patch('incus_gui.incus_operations._raw_get')
+    def test_list_containers_raw_socket(self, mock_raw_get, mock_session):
+        mock_raw_get.return_value = (200, b'{"metadata": [{"name": "test", "state": {"status": "Stopped"}}]}')
+        self.assertEqual(list_containers(), [{"name": "test", "status": "Stopped"}])
+        mock_raw_get.assert_called_once_with("/1.0/instances?recursion=1")
+        mock_session.get.assert_not_called()
+
+    @patch('incus_gui.incus_operations._SESSION')
+    @patch('incus_gui.incus_operations._raw_get', side_effect=TimeoutError("timed out"))
+    def test_list_containers_timeout_not_retried(self, mock_raw_get, mock_session):
+        with self.assertRaises(TimeoutError):
+            list_containers()
+        mock_session.get.assert_not_called()
+
+    @patch('incus_gui.incus_operations._SESSION')
+    @patch('incus_gui.incus_operations._raw_get')
+    def test_list_containers_without_recursion(self, mock_raw_get, mock_session):
+        mock_raw_get.return_value = (200, b'{"metadata": ["/1.0/instances/a", "/1.0/instances/b"]}')
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Running"}}).encode()
+        containers = list_containers()
+        self.assertEqual([c["name"] for c in containers], ["a", "b"])
+        self.assertEqual(mock_session.get.call_count, 2)
+
+    @patch('incus_gui.incus_operations._SESSION')
+    @patch('incus_gui.incus_operations._raw_get')
+    def test_list_containers_filter(self, mock_raw_get, mock_session):
+        mock_raw_get.return_value = (200, b'{"metadata": []}')
+        list_containers("status eq Running")
+        mock_raw_get.assert_called_once_with("/1.0/instances?recursion=1&filter=status%20eq%20Running")
+        mock_session.get.assert_not_called()
+
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_delete_container_success(self, mock_session):
+        mock_session.delete.return_value.status_code = 202
+        mock_session.delete.return_value.content = json.dumps({"operation": "/1.0/operations/1"}).encode()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Success"}}).encode()
         delete_container('test')
-        mock_run.assert_called_with(['incus', 'delete', 'test'], capture_output=True, text=True)
+        mock_session.delete.assert_called_with(
+            'http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0/instances/test')
+
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_delete_container_stops_first(self, mock_session):
+        for method in (mock_session.put, mock_session.delete):
+            method.return_value.status_code = 202
+            method.return_value.content = json.dumps({"operation": "/1.0/operations/1"}).encode()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Success"}}).encode()
+        delete_container('test', stop=True)
+        self.assertEqual(mock_session.put.call_args.kwargs["json"]["action"], "stop")
+        mock_session.delete.assert_called_once()
+        self.assertEqual(mock_session.get.call_count, 2)
 
-    @patch('incus_gui.incus_operations.requests_unixsocket.Session')
+    @patch('incus_gui.incus_operations._SESSION')
     def test_toggle_container_running(self, mock_session):
         mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_session.return_value.put.return_value = mock_resp
+        mock_resp.status_code = 202
+        mock_resp.content = json.dumps({"operation": "/1.0/operations/1"}).encode()
+        mock_session.put.return_value = mock_resp
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Success"}}).encode()
         toggle_container('test', 'running')
-        mock_session.return_value.put.assert_called_once()
+        mock_session.put.assert_called_once()
+        self.assertEqual(json.loads(mock_session.put.call_args.kwargs["data"])["action"], "stop")
+        mock_session.get.assert_called_once_with(
+            'http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0/operations/1/wait?timeout=40')
 
-    @patch('incus_gui.incus_operations.subprocess.run')
-    def test_list_profiles(mock_run, app):
-        mock_run.return_value.stdout = "Name\nprofile1\nprofile2"
-        mock_run.return_value.stderr = ""
-        mock_run.return_value.returncode = 0
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_restart_container_waits_for_stop(self, mock_session):
+        mock_session.put.return_value.status_code = 202
+        mock_session.put.return_value.content = json.dumps({"operation": "/1.0/operations/1"}).encode()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": {"status": "Success"}}).encode()
+        restart_container('test')
+        self.assertEqual(mock_session.put.call_count, 2)
+        mock_session.get.assert_called_once_with(
+            'http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0/operations/1/wait?timeout=5')
+
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_list_profiles(self, mock_session):
+        invalidate_profiles_cache()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({
+            "metadata": ["/1.0/profiles/default", "/1.0/profiles/profile1", "/1.0/profiles/profile2"]}).encode()
         profiles = list_profiles()
-        self.assertIn('profile1', profiles)
+        self.assertEqual(profiles, ['profile1', 'profile2'])
+        invalidate_profiles_cache()
+
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_list_profiles_cached(self, mock_session):
+        invalidate_profiles_cache()
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.content = json.dumps({"metadata": ["/1.0/profiles/profile1"]}).encode()
+        self.assertEqual(list_profiles(), list_profiles())
+        self.assertEqual(mock_session.get.call_count, 1)
+        invalidate_profiles_cache()
+
+    @patch('incus_gui.incus_operations._installed', False)
+    @patch('incus_gui.incus_operations.os.path.exists')
+    @patch('incus_gui.incus_operations.shutil.which', return_value='/usr/bin/incus')
+    def test_is_incus_installed_needs_socket(self, mock_which, mock_exists):
+        mock_exists.return_value = False
+        self.assertFalse(is_incus_installed())
+        mock_exists.return_value = True
+        self.assertTrue(is_incus_installed())
+        mock_exists.return_value = False
+        self.assertTrue(is_incus_installed())
+
+    def test_generate_preseed_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = generate_preseed_file({"storage": "pool0", "network": "br0"}, os.path.join(tmp, "preseed.yaml"))
+            with open(path) as f:
+                content = f.read()
+        self.assertIn("- name: pool0\n  driver: dir\n", content)
+        self.assertIn("- name: br0\n  type: bridge\n", content)
+
+    @patch('incus_gui.incus_operations.subprocess.run')
+    def test_get_available_incus_versions_falls_back_to_snap(self, mock_run):
+        get_available_incus_versions.cache_clear()
+        outputs = {"apt-cache": "", "snap": "Name  Version\nincus  6.0\nincus-tools  1.0\n"}
+        mock_run.side_effect = lambda cmd, **kwargs: MagicMock(stdout=outputs[cmd[0]])
+        self.assertEqual(get_available_incus_versions(), ["incus", "incus-tools"])
+        self.assertEqual(mock_run.call_count, 2)
+        get_available_incus_versions.cache_clear()
+
+    @patch('incus_gui.incus_operations._snap_incus_versions')
+    @patch('incus_gui.incus_operations._apt_incus_versions', return_value=["6.0"])
+    def test_get_available_incus_versions_skips_snap_wait(self, mock_apt, mock_snap):
+        get_available_incus_versions.cache_clear()
+        snap_done = threading.Event()
+        mock_snap.side_effect = lambda: snap_done.wait(5) and []
+        start = time.monotonic()
+        self.assertEqual(get_available_incus_versions(), ["6.0"])
+        self.assertLess(time.monotonic() - start, 1)
+        snap_done.set()
+        get_available_incus_versions.cache_clear()
+
+    def test_iter_events(self):
+        mock_resp = MagicMock()
+        mock_resp.iter_lines.return_value = [b'{"type": "lifecycle"}', b'', b'{"type": "operation"}']
+        self.assertEqual([e["type"] for e in iter_events(mock_resp)], ["lifecycle", "operation"])
+
+    def test_interrupt_event_stream_wakes_blocked_reader(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "incus.sock")
+            server = socket.socket(socket.AF_UNIX)
+            server.bind(path)
+            server.listen(1)
+
+            def serve():
+                conn, _ = server.accept()
+                conn.recv(4096)
+                # Headers only: the event stream stays open without sending events
+                conn.sendall(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n")
+                self.addCleanup(conn.close)
+
+            threading.Thread(target=serve, daemon=True).start()
+            resp = _SESSION.get(f"http+unix://{quote(path, safe='')}/1.0/events", stream=True)
+
+            def read():
+                try:
+                    list(iter_events(resp))
+                except Exception:
+                    pass  # The cut-off stream ends with a protocol error
+
+            reader = threading.Thread(target=read, daemon=True)
+            reader.start()
+            reader.join(0.2)
+            self.assertTrue(reader.is_alive())
+            interrupt_event_stream(resp)
+            reader.join(5)
+            self.assertFalse(reader.is_alive())
+            resp.close()
+            server.close()
+
+    @patch('incus_gui.incus_operations._SESSION')
+    def test_send_retries_only_get(self, mock_session):
+        error = requests.exceptions.ConnectionError("Connection aborted")
+        mock_session.get.side_effect = [error, MagicMock(status_code=200)]
+        self.assertEqual(_send("get", "url").status_code, 200)
+        self.assertEqual(mock_session.get.call_count, 2)
+        mock_session.delete.side_effect = error
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            _send("delete", "url")
+        mock_session.delete.assert_called_once()
+        mock_session.close.assert_not_called()
+
+    def test_socket_adapter_pools_per_socket(self):
+        adapter = _SocketAdapter(pool_connections=1, pool_maxsize=8)
+        first = adapter.get_connection('http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0/instances?recursion=2')
+        second = adapter.get_connection('http+unix://%2Fvar%2Flib%2Fincus%2Funix.socket/1.0/instances/test/state')
+        self.assertIs(first, second)
+        self.assertEqual(first.pool.maxsize, 8)
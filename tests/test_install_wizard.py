@@ -1,6 +1,8 @@
+import subprocess
+import sys
 import pytest
 from PySide6.QtCore import Qt
-from incus_gui.install_wizard import InstallWizard
+from incus_gui.install_wizard import InstallWizard, InstallThread
 
 @pytest.fixture
 def wizard(qtbot):
@@ -28,3 +30,13 @@ def test_valid_launch(wizard, qtbot):
     
     assert wizard.container_name == "test-container"
     assert wizard.selected_image == "ubuntu/24.04"
+
+def test_install_thread_streams_output():
+    """Command output is forwarded line by line and failures raise"""
+    thread = InstallThread({})
+    lines = []
+    thread.progress.connect(lambda step, line: lines.append((step, line)))
+    thread._run_streaming([sys.executable, "-c", "print('one'); print('two')"], 2)
+    assert lines == [(2, "one"), (2, "two")]
+    with pytest.raises(subprocess.CalledProcessError):
+        thread._run_streaming([sys.executable, "-c", "raise SystemExit(3)"], 2)
@@ -1,26 +1,152 @@
+import threading
 import pytest
 from unittest.mock import patch
 from PySide6.QtCore import Qt
-from incus_gui.main_window import IncusGui
+from PySide6.QtWidgets import QMessageBox
+from incus_gui.main_window import IncusGui, container_update_from_event
 
 @pytest.fixture
 def app(qtbot):
     """Create and return the main window"""
     window = IncusGui()
+    window.timer.stop()  # Tests trigger refreshes themselves
     qtbot.addWidget(window)
     return window
 
 def test_initial_state(app):
     """Test initial UI state"""
     assert app.windowTitle() == "Incus Container Manager (Qt 6)"
-    assert app.container_list.count() == 0  # Starts empty
+    assert app.container_model.rowCount() == 0  # Starts empty
 
 @patch('incus_gui.main_window.list_containers')
 def test_refresh_containers(mock_list, app, qtbot):
     """Test container list refresh"""
     mock_list.return_value = [{"name": "test", "status": "running"}]
+    qtbot.waitUntil(lambda: not app._inflight)
     qtbot.mouseClick(app.refresh_btn, Qt.LeftButton)
-    assert app.container_list.count() == 1
+    qtbot.waitUntil(lambda: app.container_model.index(0).data() == "test")
+    assert app.container_model.rowCount() == 1
+
+@patch('incus_gui.main_window.list_containers', return_value=[])
+def test_refresh_containers_coalesced(mock_list, app, qtbot):
+    """A burst of refresh requests costs one fetch plus one follow-up"""
+    qtbot.waitUntil(lambda: not (app._inflight or app._refresh_pending or app._refresh_debounce.isActive()))
+    mock_list.reset_mock()
+    for _ in range(3):
+        app.refresh_containers()
+    qtbot.waitUntil(lambda: mock_list.call_count == 2)
+    qtbot.wait(300)
+    assert mock_list.call_count == 2
+
+def test_refresh_error_reported_once(app, capsys):
+    """Repeated fetch errors are reported once and cleared by a successful fetch"""
+    app.populate_containers([{"name": "a", "status": "Running"}])
+    app._refresh_failed("socket down")
+    app._refresh_failed("socket down")
+    assert capsys.readouterr().out.count("socket down") == 1
+    assert app.statusBar().currentMessage() == "Exception: socket down"
+    assert names(app) == ["a"]
+    app._apply_container_list([])
+    assert app.statusBar().currentMessage() == ""
+
+def names(app):
+    return [row["name"] for row in app.container_model.rows()]
+
+def test_populate_containers_updates_in_place(app):
+    """Status changes only signal the changed rows, other changes reorder the model"""
+    app.populate_containers([{"name": "a", "status": "Stopped"}, {"name": "b", "status": "Running"}])
+    assert names(app) == ["b", "a"]
+
+    changed, resets = [], []
+    app.container_model.dataChanged.connect(lambda first, last: changed.append(first.row()))
+    app.container_model.modelReset.connect(lambda: resets.append(True))
+    app.populate_containers([{"name": "a", "status": "Frozen"}, {"name": "b", "status": "Running"}])
+    assert changed == [1] and not resets
+
+    app.populate_containers([{"name": "a", "status": "Running"}, {"name": "b", "status": "Stopped"}])
+    assert names(app) == ["a", "b"] and not resets
+
+    app.populate_containers([{"name": "a", "status": "Running"}])
+    assert names(app) == ["a"]
+    assert resets
+
+def test_container_update_from_event():
+    """Lifecycle events map to the affected container and its new status"""
+    event = {"type": "lifecycle", "metadata": {"action": "instance-started", "source": "/1.0/instances/web?project=default"}}
+    assert container_update_from_event(event) == ("web", "Running")
+    assert container_update_from_event({"type": "lifecycle", "metadata": {"action": "profile-created"}}) is None
+
+def test_apply_single_update(app):
+    """Single updates change or remove just the affected row"""
+    app.populate_containers([{"name": "a", "status": "Running"}, {"name": "b", "status": "Running"}])
+    app._apply_single_update("a", "Stopped")
+    assert app.container_model.rows() == [
+        {"name": "b", "status": "Running", "busy": False},
+        {"name": "a", "status": "Stopped", "busy": False},
+    ]
+    app._apply_single_update("b", "deleted")
+    assert names(app) == ["a"]
+
+def test_row_button_click(app, qtbot, no_incus_socket):
+    """Clicking a painted button dispatches its action for the row's container"""
+    no_incus_socket.return_value = [{"name": "a", "status": "Running"}]
+    app.refresh_containers()
+    app.show()
+    qtbot.waitExposed(app)
+    qtbot.waitUntil(lambda: app.container_model.status("a") == "Running")
+    rect = app.container_list.visualRect(app.container_model.index(0))
+    toggle_rect = app.container_delegate.button_rects(rect)[0][1]
+    with patch('incus_gui.main_window.toggle_container') as mock_toggle:
+        with qtbot.waitSignal(app.container_delegate.button_clicked) as blocker:
+            qtbot.mouseClick(app.container_list.viewport(), Qt.LeftButton, pos=toggle_rect.center())
+        assert blocker.args == ["a", "toggle"]
+        qtbot.waitUntil(lambda: mock_toggle.called and not app._actions)
+    mock_toggle.assert_called_once_with("a", "Running")
+
+@patch('incus_gui.main_window.toggle_container')
+def test_toggle_container_runs_in_background(mock_toggle, app, qtbot):
+    """The row is busy while the toggle runs on the thread pool"""
+    app.populate_containers([{"name": "a", "status": "Running"}])
+    app.toggle_container("a", "Running")
+    assert app.container_model.rows()[0]["busy"]
+    qtbot.waitUntil(lambda: "a" not in app._actions)
+    mock_toggle.assert_called_once_with("a", "Running")
+
+def test_refresh_not_blocked_by_actions(app, qtbot, no_incus_socket):
+    """Refreshes don't queue behind long-running container operations"""
+    qtbot.waitUntil(lambda: not (app._inflight or app._refresh_pending or app._refresh_debounce.isActive()))
+    release = threading.Event()
+    with patch('incus_gui.main_window.toggle_container', side_effect=lambda *args: release.wait(5)):
+        for name in ("a", "b", "c", "d"):
+            app.toggle_container(name, "Running")
+        no_incus_socket.reset_mock()
+        app.refresh_containers()
+        qtbot.waitUntil(lambda: no_incus_socket.called, timeout=1000)
+        release.set()
+        qtbot.waitUntil(lambda: not app._actions)
+
+@patch('incus_gui.main_window.delete_container')
+@patch('incus_gui.main_window.QMessageBox.question', return_value=QMessageBox.Yes)
+def test_delete_container_runs_in_background(mock_question, mock_delete, app, qtbot):
+    """The row is busy while the delete runs and is removed once it succeeds"""
+    app.populate_containers([{"name": "a", "status": "Running"}])
+    app.confirm_delete_container("a", "Running")
+    assert app.container_model.rows()[0]["busy"]
+    qtbot.waitUntil(lambda: names(app) == [])
+    mock_delete.assert_called_once_with("a", True)
+
+def test_events_resubscribe_with_backoff(app, no_incus_socket):
+    """A dropped event stream is retried with backoff and polling slows down on reconnect"""
+    app.events_stopped()
+    assert app.timer.interval() == 5000
+    assert app._events_retry.isActive() and app._events_retry.interval() == 5000
+    app.events_stopped()
+    assert app._events_retry.interval() == 10000
+    no_incus_socket.reset_mock()
+    app.events_connected()
+    assert app.timer.interval() == 30000
+    assert app._events_retry_ms == 5000
+    assert app._refresh_pending or app._inflight or no_incus_socket.called
 
 @patch('incus_gui.main_window.launch_container')
 def test_launch_container_dialog(mock_launch, app, qtbot):